@@ -15,7 +15,9 @@ Why it exists:
 This script is intentionally simple and is meant for local developer use.
 """
 
+import io
 import os
+import shutil
 
 log_file = r"c:\Users\Dean\source\repos\Synapic\logs\synapic.log"
 bytes_to_read = 5000
@@ -25,9 +27,11 @@ try:
         f.seek(0, os.SEEK_END)
         file_size = f.tell()
         f.seek(max(file_size - bytes_to_read, 0))
-        content = f.read().decode('utf-8', errors='ignore')
-        with open("latest_log.txt", "w", encoding="utf-8") as out:
-            out.write(content)
+        # Stream the tail straight into the output file instead of building
+        # the decoded text in memory; newline='' keeps line endings untouched.
+        src = io.TextIOWrapper(f, encoding='utf-8', errors='ignore', newline='')
+        with open("latest_log.txt", "w", encoding="utf-8", newline='') as out:
+            shutil.copyfileobj(src, out, 1 << 20)
         print("Log tail written to latest_log.txt")
 except Exception as e:
     print(f"Error reading file: {e}")
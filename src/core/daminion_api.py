@@ -25,6 +25,7 @@ import urllib.request
 import urllib.parse
 import urllib.error
 import json
+import threading
 import time
 from typing import Dict, List, Optional, Any, Union, Tuple
 from dataclasses import dataclass
@@ -67,6 +68,19 @@ class DaminionPermissionError(DaminionAPIError):
     pass
 
 
+# Keys that may carry the display text of a tag value, in priority order.
+_TAG_VALUE_TEXT_KEYS = ('text', 'value', 'name', 'title')
+
+
+def _first_truthy(mapping: Dict, keys: Tuple[str, ...], default: Any = None) -> Any:
+    """Return the first truthy value found under ``keys``, else ``default``."""
+    for key in keys:
+        value = mapping.get(key)
+        if value:
+            return value
+    return default
+
+
 # ============================================================================
 # ENUMS & DATA CLASSES
 # ============================================================================
@@ -245,6 +259,10 @@ class DaminionAPI:
         self._cookies: Dict[str, str] = {}
         self._authenticated = False
         self._last_request_time = 0.0
+        self._rate_lock = threading.Lock()
+        # Guards cookies, auth flag and metrics so requests may run from
+        # several threads; network I/O itself happens outside the lock.
+        self._state_lock = threading.Lock()
         # Observability metrics
         self._request_count: int = 0
         self._latency_by_endpoint: Dict[str, List[float]] = {}
@@ -314,7 +332,10 @@ class DaminionAPI:
                 skip_auth=True
             )
             
-            self._authenticated = True
+            # Session cookies from the login response were merged under the
+            # same lock in _make_request.
+            with self._state_lock:
+                self._authenticated = True
             logging.info(f"Successfully authenticated as {self.username}")
             return True
             
@@ -330,8 +351,9 @@ class DaminionAPI:
             except Exception as e:
                 logging.warning(f"Logout error: {e}")
             finally:
-                self._authenticated = False
-                self._cookies.clear()
+                with self._state_lock:
+                    self._authenticated = False
+                    self._cookies.clear()
     
     def is_authenticated(self) -> bool:
         """Check if currently authenticated."""
@@ -342,12 +364,13 @@ class DaminionAPI:
     # ------------------------------------------------------------------------
     
     def _enforce_rate_limit(self):
-        """Enforce rate limiting between API calls."""
-        if self.rate_limit > 0:
-            elapsed = time.time() - self._last_request_time
-            if elapsed < self.rate_limit:
-                time.sleep(self.rate_limit - elapsed)
-        self._last_request_time = time.time()
+        """Enforce rate limiting between API calls (safe across threads)."""
+        with self._rate_lock:
+            if self.rate_limit > 0:
+                elapsed = time.time() - self._last_request_time
+                if elapsed < self.rate_limit:
+                    time.sleep(self.rate_limit - elapsed)
+            self._last_request_time = time.time()
     
     def _get_cookie_header(self) -> str:
         """Generate cookie header string from stored cookies."""
@@ -355,6 +378,12 @@ class DaminionAPI:
             return ""
         return "; ".join(f"{k}={v}" for k, v in self._cookies.items())
     
+    def _build_url(self, endpoint: str, params: Optional[Dict] = None) -> str:
+        """Build the full request URL for an endpoint and its query parameters."""
+        if not params:
+            return f"{self.base_url}{endpoint}"
+        return f"{self.base_url}{endpoint}?{urllib.parse.urlencode(params)}"
+    
     def _make_request(
         self,
         endpoint: str,
@@ -381,21 +410,20 @@ class DaminionAPI:
         Raises:
             DaminionAPIError: For various API errors
         """
-        if not skip_auth and not self._authenticated:
-            raise DaminionAuthenticationError("Not authenticated. Call authenticate() first.")
+        with self._state_lock:
+            if not skip_auth and not self._authenticated:
+                raise DaminionAuthenticationError("Not authenticated. Call authenticate() first.")
+            # Increment request counter for observability
+            self._request_count += 1
+            cookie_header = self._get_cookie_header()
         # Start timing for observability
         start_time = time.time()
-        # Increment request counter for observability
-        self._request_count += 1
 
         if not skip_rate_limit:
             self._enforce_rate_limit()
         
         # Build URL
-        url = f"{self.base_url}{endpoint}"
-        if params:
-            query_string = urllib.parse.urlencode(params)
-            url = f"{url}?{query_string}"
+        url = self._build_url(endpoint, params)
         
         # Build request
         headers = {
@@ -403,8 +431,8 @@ class DaminionAPI:
             "Accept": "application/json"
         }
         
-        if self._cookies:
-            headers["Cookie"] = self._get_cookie_header()
+        if cookie_header:
+            headers["Cookie"] = cookie_header
         
         request_body = None
         if data is not None:
@@ -420,13 +448,16 @@ class DaminionAPI:
         try:
             with urllib.request.urlopen(req, timeout=self.timeout) as response:
                 # Store cookies from response
-                cookie_header = response.getheader('Set-Cookie')
-                if cookie_header:
-                    for cookie in cookie_header.split(','):
+                set_cookie = response.getheader('Set-Cookie')
+                if set_cookie:
+                    new_cookies = {}
+                    for cookie in set_cookie.split(','):
                         if '=' in cookie:
                             key, value = cookie.split('=', 1)
                             value = value.split(';')[0].strip()
-                            self._cookies[key.strip()] = value
+                            new_cookies[key.strip()] = value
+                    with self._state_lock:
+                        self._cookies.update(new_cookies)
                 
                 # Parse response
                 content_type = response.getheader('Content-Type', '')
@@ -447,24 +478,22 @@ class DaminionAPI:
                             return result['data']
                     
                     # Observability: latency per endpoint
-                    duration = (time.time() - start_time) * 1000
-                    self._latency_by_endpoint[endpoint] = self._latency_by_endpoint.get(endpoint, []) + [duration]
+                    self._record_latency(endpoint, start_time)
                     return result
                 else:
                     # Return raw binary data (for images, files, etc.)
                     # Observability: latency for non-json endpoints
-                    duration = (time.time() - start_time) * 1000
-                    self._latency_by_endpoint[endpoint] = self._latency_by_endpoint.get(endpoint, []) + [duration]
+                    self._record_latency(endpoint, start_time)
                     return response_data
                     
         except urllib.error.HTTPError as e:
             error_msg = f"HTTP {e.code}: {e.reason}"
             # Observability: record latency on error path
-            duration = (time.time() - start_time) * 1000
-            self._latency_by_endpoint[endpoint] = self._latency_by_endpoint.get(endpoint, []) + [duration]
+            self._record_latency(endpoint, start_time)
             
             if e.code == 401:
-                self._authenticated = False
+                with self._state_lock:
+                    self._authenticated = False
                 raise DaminionAuthenticationError(f"Authentication required: {error_msg}")
             elif e.code == 403:
                 raise DaminionPermissionError(f"Permission denied: {error_msg}")
@@ -477,30 +506,39 @@ class DaminionAPI:
                 
         except urllib.error.URLError as e:
             # Observability: record latency on error path
-            duration = (time.time() - start_time) * 1000
-            self._latency_by_endpoint[endpoint] = self._latency_by_endpoint.get(endpoint, []) + [duration]
-            self._error_counts["URLError"] = self._error_counts.get("URLError", 0) + 1
+            self._record_latency(endpoint, start_time, error="URLError")
             raise DaminionNetworkError(f"Network error: {e.reason}")
         except json.JSONDecodeError as e:
             raise DaminionAPIError(f"Invalid JSON response: {e}")
         except Exception as e:
             raise DaminionAPIError(f"Request failed: {e}")
 
+    def _record_latency(
+        self, endpoint: str, start_time: float, error: Optional[str] = None
+    ) -> None:
+        """Record a request's latency (and optional error kind) under the state lock."""
+        duration = (time.time() - start_time) * 1000
+        with self._state_lock:
+            self._latency_by_endpoint.setdefault(endpoint, []).append(duration)
+            if error:
+                self._error_counts[error] = self._error_counts.get(error, 0) + 1
+
     def get_request_count(self) -> int:
         """Return the number of API requests performed (observability)."""
         return self._request_count
 
     def get_metrics(self) -> Dict[str, Any]:
         """Return a lightweight metrics snapshot for observability."""
-        latency_summary = {
-            ep: (sum(vals) / len(vals)) if vals else 0.0
-            for ep, vals in self._latency_by_endpoint.items()
-        }
-        return {
-            "requests": self._request_count,
-            "latency_ms_by_endpoint": latency_summary,
-            "errors": dict(self._error_counts),
-        }
+        with self._state_lock:
+            latency_summary = {
+                ep: (sum(vals) / len(vals)) if vals else 0.0
+                for ep, vals in self._latency_by_endpoint.items()
+            }
+            return {
+                "requests": self._request_count,
+                "latency_ms_by_endpoint": latency_summary,
+                "errors": dict(self._error_counts),
+            }
 
     def get_metrics_json(self) -> str:
         """Return metrics in JSON format for easy ingestion by dashboards."""
@@ -516,9 +554,10 @@ class DaminionAPI:
 
     def reset_metrics(self) -> None:
         """Reset observability counters and latencies."""
-        self._request_count = 0
-        self._latency_by_endpoint.clear()
-        self._error_counts.clear()
+        with self._state_lock:
+            self._request_count = 0
+            self._latency_by_endpoint.clear()
+            self._error_counts.clear()
 
 
 # ============================================================================
@@ -880,10 +919,11 @@ class TagsAPI(BaseAPI):
         
         # Build TagValue list, matching exact keyword case-insensitively
         result = []
+        target = filter_text.lower()
         for v in values_data:
-            text = v.get('text') or v.get('value') or v.get('name') or v.get('title') or ''
+            text = _first_truthy(v, _TAG_VALUE_TEXT_KEYS, '')
             # Only include if it matches the filter text (case-insensitive exact match)
-            if text.lower() == filter_text.lower():
+            if text.lower() == target:
                 result.append(TagValue(
                     id=v.get('id') or v.get('valueId', 0),
                     text=text,
@@ -41,6 +41,9 @@ from .daminion_api import (
 
 logger = logging.getLogger(__name__)
 
+# Largest page the Daminion search endpoint will return in one response.
+MAX_PAGE_SIZE = 500
+
 
 class DaminionClient:
     """
@@ -529,7 +532,7 @@ class DaminionClient:
             # Always return a single batch – the ProcessingManager outer loop
             # is responsible for driving pagination across pages.
             limit = max_items if max_items and max_items > 0 else float("inf")
-            batch_size = 500 if limit > 500 else int(limit)
+            batch_size = int(min(MAX_PAGE_SIZE, limit))
             current_index = start_index
             # Always stop after one batch; the caller advances start_index.
             single_page = True
@@ -79,6 +79,35 @@ from typing import Optional, Dict, Any, List, Tuple
 # On Windows without Developer Mode, symlink creation fails with WinError 1314
 _USE_SYMLINKS = "auto" if os.name != "nt" else False
 _LOCAL_INFERENCE_COMPAT_CACHE: Dict[Tuple[str, str], Optional[str]] = {}
+# Local snapshot paths already resolved by load_model, keyed by (model_id, token)
+_RESOLVED_MODEL_PATHS: Dict[Tuple[str, Optional[str]], str] = {}
+
+
+def _low_cpu_mem_usage(device: int) -> bool:
+    """
+    Decide whether pipelines load weights with ``low_cpu_mem_usage``.
+
+    The flag lowers peak RAM but makes loading slower, which only pays off when
+    the weights are headed for an accelerator. It defaults to on for GPU and off
+    for CPU; set ``SYNAPIC_LOW_CPU_MEM`` to ``1`` or ``0`` to force either way.
+    """
+    override = os.environ.get("SYNAPIC_LOW_CPU_MEM", "").strip().lower()
+    if override in ("1", "true", "yes", "on"):
+        return True
+    if override in ("0", "false", "no", "off"):
+        return False
+    return device != -1
+
+
+def _load_dtype(device: int) -> torch.dtype:
+    """
+    Pick the dtype pipelines load weights in.
+
+    ``"auto"`` frequently resolves to float32, which stages a full-precision
+    copy of the weights in RAM before they move to the GPU. Loading straight
+    into float16 on accelerators avoids that peak; CPU stays in float32.
+    """
+    return torch.float16 if device != -1 else torch.float32
 
 
 def get_device_info() -> Dict[str, Any]:
@@ -322,6 +351,7 @@ def clear_cache():
     if cache_path.exists():
         shutil.rmtree(cache_path)
         logging.info("Hugging Face cache cleared.")
+    _RESOLVED_MODEL_PATHS.clear()
 
 
 def get_model_cache_dir(model_id):
@@ -436,6 +466,27 @@ def _get_latest_snapshot_path(model_id: str) -> Optional[str]:
     return os.path.join(snapshot_dir, latest_snapshot)
 
 
+def _resolved_model_path(model_id: str, token: Optional[str] = None) -> Optional[str]:
+    """
+    Return the local snapshot path for a fully downloaded model, or None.
+
+    The answer is remembered for the process, so repeat loads of the same model
+    skip the Hub round trip inside ``is_model_downloaded``. A remembered path is
+    dropped if its snapshot directory has since been deleted.
+    """
+    key = (model_id, token)
+    cached = _RESOLVED_MODEL_PATHS.get(key)
+    if cached is not None and os.path.isdir(cached):
+        return cached
+
+    if not is_model_downloaded(model_id, token=token):
+        return None
+    path = _get_latest_snapshot_path(model_id)
+    if path is not None:
+        _RESOLVED_MODEL_PATHS[key] = path
+    return path
+
+
 def _get_missing_repo_files(
     model_id: str, token=None
 ) -> Tuple[Any, List[Tuple[str, int]]]:
@@ -962,8 +1013,8 @@ def _legacy_load_model_with_progress(model_id, task, q, token=None, device=-1):
             model=local_model_path,
             device_map="auto" if device != -1 else None,
             device=device if device == -1 else None,
-            torch_dtype="auto",
-            model_kwargs={"low_cpu_mem_usage": True},
+            torch_dtype=_load_dtype(device),
+            model_kwargs={"low_cpu_mem_usage": _low_cpu_mem_usage(device)},
         )
 
         logging.info(f"Model pipeline ({task}) loaded successfully for: {model_id}")
@@ -1044,8 +1095,8 @@ def load_model_with_progress(model_id, task, q, token=None, device=-1):
             model=local_model_path,
             device_map="auto" if device != -1 else None,
             device=device if device == -1 else None,
-            torch_dtype="auto",
-            model_kwargs={"low_cpu_mem_usage": True},
+            torch_dtype=_load_dtype(device),
+            model_kwargs={"low_cpu_mem_usage": _low_cpu_mem_usage(device)},
         )
 
         logging.info(f"Model pipeline ({task}) loaded successfully for: {model_id}")
@@ -1113,6 +1164,7 @@ def load_model(
     progress_queue: Optional[Any] = None,
     token: Optional[str] = None,
     device: int = -1,
+    compile_model: bool = False,
 ) -> Any:
     """
     Synchronously load a Hugging Face model and initialize a pipeline.
@@ -1129,6 +1181,9 @@ def load_model(
         progress_queue: Optional queue for status and percentage updates.
         token: Optional Hugging Face API token for private/gated models.
         device: Device ID to load onto (-1 for CPU, 0+ for CUDA/MPS).
+        compile_model: Wrap the pipeline's model in ``torch.compile`` with
+            ``mode="reduce-overhead"``. The first few inferences are slower
+            while graphs compile; later ones skip most kernel-launch overhead.
 
     Returns:
         The initialized transformers Pipeline object.
@@ -1151,7 +1206,12 @@ def load_model(
                 )
             )
 
-        if not is_model_downloaded(model_id, token=token):
+        local_model_path = _resolved_model_path(model_id, token=token)
+        if local_model_path is not None:
+            logging.info(
+                f"Model {model_id} is already downloaded (sync): {local_model_path}"
+            )
+        else:
             logging.info(f"Downloading model files for {model_id} (sync)...")
             if q:
                 local_model_path = _download_missing_files_with_progress(
@@ -1165,27 +1225,7 @@ def load_model(
                     local_dir_use_symlinks=_USE_SYMLINKS,
                 )
             logging.info(f"Model download complete for {model_id} (sync).")
-        else:
-            logging.info(f"Model {model_id} is already downloaded (sync).")
-            model_cache_dir = get_model_cache_dir(model_id)
-            snapshot_dir = os.path.join(model_cache_dir, "snapshots")
-            snapshots = os.listdir(snapshot_dir)
-            if snapshots:
-                latest_snapshot = sorted(snapshots)[-1]
-                local_model_path = os.path.join(snapshot_dir, latest_snapshot)
-                logging.info(f"Using latest snapshot: {latest_snapshot}")
-            else:
-                # Should typically not happen if is_model_downloaded returned True,
-                # but good for safety.
-                logging.warning(
-                    f"Snapshot directory exists but is empty for {model_id}. Re-downloading..."
-                )
-                local_model_path = snapshot_download(
-                    repo_id=model_id,
-                    tqdm_class=SilentTqdm,
-                    token=token,
-                    local_dir_use_symlinks=_USE_SYMLINKS,
-                )
+            _RESOLVED_MODEL_PATHS[(model_id, token)] = local_model_path
 
         if q:
             q.put(("status_update", f"Initializing model {model_id}..."))
@@ -1270,9 +1310,9 @@ def load_model(
             )
 
         # Load model using memory optimizations:
-        # - low_cpu_mem_usage: reduces peak RAM (passed via model_kwargs to avoid
-        #   _sanitize_parameters() rejection in task-specific pipelines)
-        # - torch_dtype="auto": uses float16 on GPU if available
+        # - low_cpu_mem_usage: reduces peak RAM on GPU loads (passed via model_kwargs
+        #   to avoid _sanitize_parameters() rejection in task-specific pipelines)
+        # - torch_dtype: float16 on GPU so weights are never staged in float32
         # - device_map="auto": handles complex device placement (requires accelerate)
         model = pipeline(
             pipeline_task,
@@ -1280,10 +1320,14 @@ def load_model(
             processor=processor,
             device_map="auto" if device != -1 else None,
             device=device if device == -1 else None,
-            torch_dtype="auto",
-            model_kwargs={"low_cpu_mem_usage": True},
+            torch_dtype=_load_dtype(device),
+            model_kwargs={"low_cpu_mem_usage": _low_cpu_mem_usage(device)},
         )
 
+        if compile_model:
+            model.model = torch.compile(model.model, mode="reduce-overhead")
+            logging.info(f"Compiled model with torch.compile for: {model_id}")
+
         logging.info(
             f"Model pipeline ({pipeline_task}) loaded successfully for: {model_id} on device {device}"
         )
@@ -1386,6 +1430,24 @@ def rate_limit_handler(max_retries=3, initial_delay=1.0):
     return decorator
 
 
+_INFERENCE_SESSION: Optional[requests.Session] = None
+_INFERENCE_SESSION_LOCK = RLock()
+
+
+def _get_inference_session() -> requests.Session:
+    """
+    Return the shared HTTP session used for raw Inference API calls.
+
+    Reusing one session keeps the connection to the router endpoint alive
+    between images instead of paying a fresh TCP/TLS handshake per request.
+    """
+    global _INFERENCE_SESSION
+    with _INFERENCE_SESSION_LOCK:
+        if _INFERENCE_SESSION is None:
+            _INFERENCE_SESSION = requests.Session()
+        return _INFERENCE_SESSION
+
+
 @rate_limit_handler(max_retries=3)
 def run_inference_api(model_id, image_path, task, token, parameters=None):
     """
@@ -1447,7 +1509,9 @@ def run_inference_api(model_id, image_path, task, token, parameters=None):
 
                 log_api_request(logger, "POST", api_url, headers=headers, data=payload)
 
-                response = requests.post(api_url, headers=headers, json=payload)
+                response = _get_inference_session().post(
+                    api_url, headers=headers, json=payload
+                )
                 del payload  # Free the payload immediately after sending
                 elapsed = time.time() - start_time
 
@@ -1504,7 +1568,9 @@ def run_inference_api(model_id, image_path, task, token, parameters=None):
                 )
                 headers = {"Authorization": f"Bearer {token}"}
 
-                response = requests.post(api_url, headers=headers, json=payload)
+                response = _get_inference_session().post(
+                    api_url, headers=headers, json=payload
+                )
                 del payload  # Free immediately after sending
                 try:
                     response.raise_for_status()
@@ -1536,7 +1602,9 @@ def run_inference_api(model_id, image_path, task, token, parameters=None):
                 )
                 headers = {"Authorization": f"Bearer {token}"}
 
-                response = requests.post(api_url, headers=headers, json=payload)
+                response = _get_inference_session().post(
+                    api_url, headers=headers, json=payload
+                )
                 del payload  # Free immediately after sending
                 response.raise_for_status()
                 result = response.json()
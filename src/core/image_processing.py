@@ -237,24 +237,23 @@ def write_metadata(
     try:
         logging.info(f"Writing EXIF metadata to {image_path.name}")
         exif_dict = piexif.load(str(image_path))
+        # Bind the IFD table and tag namespace once for the writes below
+        zeroth = exif_dict["0th"]
+        ifd = piexif.ImageIFD
 
         if category:
             # Map Category/Label to Windows 'Subject' and 'Title'
-            exif_dict["0th"][piexif.ImageIFD.XPSubject] = category.encode("utf-16le")
-            exif_dict["0th"][piexif.ImageIFD.XPTitle] = category.encode("utf-16le")
+            zeroth[ifd.XPSubject] = category.encode("utf-16le")
+            zeroth[ifd.XPTitle] = category.encode("utf-16le")
 
         if description:
             # EXIF ImageDescription - standard ascii for cross-platform compatibility
-            exif_dict["0th"][piexif.ImageIFD.ImageDescription] = description.encode(
-                "utf-8"
-            )
+            zeroth[ifd.ImageDescription] = description.encode("utf-8")
             # Map long AI Caption/Description to Windows 'Comments'
-            exif_dict["0th"][piexif.ImageIFD.XPComment] = description.encode("utf-16le")
+            zeroth[ifd.XPComment] = description.encode("utf-16le")
 
         if keywords:
-            existing_keywords_bytes = exif_dict["0th"].get(
-                piexif.ImageIFD.XPKeywords, b""
-            )
+            existing_keywords_bytes = zeroth.get(ifd.XPKeywords, b"")
 
             # Piexif can sometimes return tuple of ints instead of bytes
             if isinstance(existing_keywords_bytes, tuple):
@@ -279,9 +278,7 @@ def write_metadata(
                     existing_keywords.append(k)
                     existing_set.add(k)
 
-            exif_dict["0th"][piexif.ImageIFD.XPKeywords] = ";".join(
-                existing_keywords
-            ).encode("utf-16le")
+            zeroth[ifd.XPKeywords] = ";".join(existing_keywords).encode("utf-16le")
 
         exif_bytes = piexif.dump(exif_dict)
         piexif.insert(exif_bytes, str(image_path))
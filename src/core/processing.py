@@ -54,6 +54,8 @@ from . import huggingface_utils
 from . import openrouter_utils
 from . import image_processing
 from . import config
+from .daminion_client import MAX_PAGE_SIZE
+from src.utils.concurrency import DaemonThreadPoolExecutor
 
 # Optional Groq integration (for Groq SDK-based inference)
 try:
@@ -108,6 +110,11 @@ except ImportError:
     # Fallback if tests is not in path (e.g. when packaged)
     verifier = None
 
+# Run gc.collect after every N processed items to release residual base64
+# strings and API response objects. Small enough to bound memory pressure,
+# large enough that collection overhead stays negligible.
+GC_ITEM_INTERVAL = 3
+
 
 # ============================================================================
 # PROCESSING MANAGER
@@ -249,7 +256,7 @@ class ProcessingManager:
            fetch the next page and repeat until exhausted
         5. Cleanup on completion
         """
-        DAMINION_PAGE_SIZE = 500  # Hard limit imposed by Daminion API
+        DAMINION_PAGE_SIZE = MAX_PAGE_SIZE  # Hard limit imposed by Daminion API
 
         try:
             self.log("Job started.")
@@ -384,6 +391,9 @@ class ProcessingManager:
                 except Exception as e:
                     self.logger.warning(f"Pre-flight count failed (non-fatal): {e}")
 
+            # The count is only used for logging and the ETA: it is built from a
+            # different query than get_items_filtered and reports 0 for any
+            # unexpected response, so the first fetched page stays authoritative.
             while True:
                 if (
                     process_limit is not None
@@ -474,7 +484,8 @@ class ProcessingManager:
                 # ============================================================
                 processed_before_batch = self.session.processed_items
                 # ============================================================
-                for i, item in enumerate(items):
+                prefetched = self._with_prefetched_images(items, process_limit)
+                for i, (item, image) in enumerate(prefetched):
                     if self.stop_event.is_set():
                         self.logger.info(
                             f"Job aborted by user after processing "
@@ -485,7 +496,7 @@ class ProcessingManager:
                         # do NOT del here to avoid UnboundLocalError.
                         break
 
-                    self._process_single_item(item)
+                    self._process_single_item(item, image)
 
                     self.session.processed_items += 1
                     grand_total_processed += 1
@@ -817,7 +828,98 @@ class ProcessingManager:
         except Exception as e:
             raise RuntimeError(f"Failed to load model: {e}")
 
-    def _process_single_item(self, item):
+    def _with_prefetched_images(self, items, process_limit=None):
+        """
+        Yield ``(item, image)`` pairs for one page of items.
+
+        For Daminion items ``image`` is a future resolving to the downloaded
+        image path; the download for item N+1 is started while item N is
+        being processed, so network time overlaps with inference. Local
+        items are yielded with ``image=None`` and loaded from disk as usual.
+
+        No download is started for an item the loop will never reach: once an
+        abort is requested or ``process_limit`` will be met by the current
+        item, later items are yielded with ``image=None`` instead.
+        """
+        if not items or not isinstance(items[0], dict):
+            for item in items:
+                yield item, None
+            return
+
+        def _next_item_wanted():
+            if self.stop_event.is_set():
+                return False
+            # processed_items does not yet include the item about to be yielded
+            return (
+                process_limit is None
+                or self.session.processed_items + 1 < process_limit
+            )
+
+        pool = DaemonThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="ImagePrefetch"
+        )
+        pending = None
+        try:
+            pending = pool.submit(self._download_daminion_image, items[0])
+            for current, upcoming in zip(items, items[1:]):
+                image = pending
+                pending = None
+                if _next_item_wanted():
+                    pending = pool.submit(self._download_daminion_image, upcoming)
+                yield current, image
+            image, pending = pending, None
+            yield items[-1], image
+        finally:
+            # Drop a queued download if the caller stopped early
+            if pending is not None:
+                pending.cancel()
+            pool.shutdown(wait=False)
+
+    def _download_daminion_image(self, item):
+        """
+        Download the image for a Daminion item at the configured resolution.
+
+        Args:
+            item: Daminion item dict with an ``id`` key.
+
+        Returns:
+            Path: Temporary file holding the downloaded image.
+
+        Raises:
+            RuntimeError: If the server did not return an image.
+        """
+        daminion_client = self.session.daminion_client
+        item_id = item.get("id")
+        # Download image (server-side resized for faster AI inference)
+        # Use original at 100%, proportionally scaled preview at lower scales,
+        # or a fixed 200px thumbnail when override is enabled
+        ds = self.session.datasource
+        if getattr(ds, "use_thumbnail_override", False):
+            # Fixed 200px thumbnail — fast, consistent, minimal bandwidth
+            path = daminion_client.download_thumbnail(item_id, width=200, height=200)
+            if not path or not path.exists():
+                raise RuntimeError(f"Could not download thumbnail for item {item_id}")
+        else:
+            scale = getattr(ds, "resize_scale", 100)
+            if scale >= 100:
+                path = daminion_client.download_original(item_id)
+                if not path or not path.exists():
+                    raise RuntimeError(f"Could not download original for item {item_id}")
+            else:
+                # Get original dimensions first to calculate proportional target size
+                dims = daminion_client.get_item_dimensions(item_id)
+                if dims:
+                    orig_w, orig_h = dims
+                    target_w = max(75, int(orig_w * scale / 100))
+                else:
+                    # Fallback: use scale of a base 2000px size
+                    target_w = max(75, int(2000 * scale / 100))
+                path = daminion_client.download_preview(item_id, width=target_w)
+                if not path or not path.exists():
+                    raise RuntimeError(f"Could not download preview for item {item_id}")
+        return path
+
+    def _process_single_item(self, item, image=None):
         """
         Process a single image item through the complete AI tagging pipeline.
 
@@ -829,6 +931,8 @@ class ProcessingManager:
 
         Args:
             item: Either a Path object (local file) or dict (Daminion item with 'id', 'fileName')
+            image: Optional future resolving to the already-downloaded image
+                path for a Daminion item (see ``_with_prefetched_images``).
 
         Processing Flow:
             - Detects item type (local vs Daminion) and loads image accordingly
@@ -869,41 +973,11 @@ class ProcessingManager:
                 self.logger.debug(f"Processing Daminion item {item_id}: {filename}")
                 self.log(f"Processing Daminion Item: {filename}...")
 
-                # Download image (server-side resized for faster AI inference)
-                # Use original at 100%, proportionally scaled preview at lower scales,
-                # or a fixed 200px thumbnail when override is enabled
-                ds = self.session.datasource
-                if getattr(ds, "use_thumbnail_override", False):
-                    # Fixed 200px thumbnail — fast, consistent, minimal bandwidth
-                    path = daminion_client.download_thumbnail(
-                        item_id, width=200, height=200
-                    )
-                    if not path or not path.exists():
-                        raise RuntimeError(
-                            f"Could not download thumbnail for item {item_id}"
-                        )
+                if image is not None:
+                    # Downloaded in the background while the previous item ran
+                    path = image.result()
                 else:
-                    scale = getattr(ds, "resize_scale", 100)
-                    if scale >= 100:
-                        path = daminion_client.download_original(item_id)
-                        if not path or not path.exists():
-                            raise RuntimeError(
-                                f"Could not download original for item {item_id}"
-                            )
-                    else:
-                        # Get original dimensions first to calculate proportional target size
-                        dims = daminion_client.get_item_dimensions(item_id)
-                        if dims:
-                            orig_w, orig_h = dims
-                            target_w = max(75, int(orig_w * scale / 100))
-                        else:
-                            # Fallback: use scale of a base 2000px size
-                            target_w = max(75, int(2000 * scale / 100))
-                        path = daminion_client.download_preview(item_id, width=target_w)
-                        if not path or not path.exists():
-                            raise RuntimeError(
-                                f"Could not download preview for item {item_id}"
-                            )
+                    path = self._download_daminion_image(item)
             else:
                 path = item
                 self.logger.debug(f"Processing local file: {path}")
@@ -1360,6 +1434,8 @@ class ProcessingManager:
 
             # Periodic garbage collection to free any residual base64 strings,
             # API response objects, and other short-lived allocations.
-            # Every 3 items balances GC overhead with memory pressure.
-            if hasattr(self, "session") and self.session.processed_items % 3 == 0:
+            if (
+                hasattr(self, "session")
+                and self.session.processed_items % GC_ITEM_INTERVAL == 0
+            ):
                 gc.collect()
@@ -47,6 +47,12 @@ KNOWN_MODELS = [
 ]
 
 
+def _read_and_encode(image_path: str) -> str:
+    """Read an image file from disk and return its base64 text."""
+    with open(image_path, "rb") as fh:
+        return base64.b64encode(fh.read()).decode()
+
+
 class CerebrasClient:
     """Client for Cerebras Inference API.
 
@@ -223,8 +229,7 @@ class CerebrasClient:
         # Read and encode image
         # ------------------------------------------------------------------
         try:
-            with open(image_path, "rb") as fh:
-                image_b64 = base64.b64encode(fh.read()).decode()
+            image_b64 = _read_and_encode(image_path)
         except Exception as exc:
             return f"Error reading image file: {exc}"
 
@@ -8,6 +8,7 @@ Supports multimodal chat completions for image analysis.
 
 import logging
 import base64
+import mmap
 import os
 import requests
 from typing import Optional, List, Dict, Any
@@ -73,6 +74,10 @@ class NvidiaClient:
             
         return models
 
+    def _image_exists(self, image_path: str) -> bool:
+        """Return True if the image file is present on disk."""
+        return os.path.exists(image_path)
+
     def chat_with_image(self, model_name: str, prompt: str, image_path: str) -> str:
         """Send a prompt with an image to an Nvidia NIM model.
         
@@ -87,12 +92,19 @@ class NvidiaClient:
         if not self.api_key:
             raise RuntimeError("Nvidia API key not configured")
         
-        if not os.path.exists(image_path):
+        if not self._image_exists(image_path):
             raise FileNotFoundError(f"Image path not found: {image_path}")
 
         try:
             with open(image_path, "rb") as f:
-                image_b64 = base64.b64encode(f.read()).decode()
+                if os.fstat(f.fileno()).st_size == 0:
+                    # mmap cannot map an empty file
+                    image_b64 = ""
+                else:
+                    # Encode straight from a read-only mapping; f.read() would
+                    # add a full-size bytes copy of the image before encoding.
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                        image_b64 = base64.b64encode(data).decode()
 
             # Determine file extension/type for the data URI
             ext = os.path.splitext(image_path)[1].lower().replace('.', '')
@@ -26,6 +26,7 @@ import customtkinter as ctk
 import logging
 from tkinter import messagebox
 from src.utils.background_worker import BackgroundWorker
+from src.utils.concurrency import DaemonThreadPoolExecutor
 
 
 class Step1Datasource(ctk.CTkFrame):
@@ -800,15 +801,22 @@ class Step1Datasource(ctk.CTkFrame):
             if not client:
                 return
 
+            # Both lookups are independent reads, so overlap the round trips.
+            with DaemonThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="DaminionLookup"
+            ) as pool:
+                searches_future = pool.submit(client.get_saved_searches)
+                cols_future = pool.submit(client.get_shared_collections)
+                searches = searches_future.result()
+                cols = cols_future.result()
+
             # 1. Saved Searches
-            searches = client.get_saved_searches()
             self._ss_map = {
                 s.get("name"): s.get("id") for s in searches if s.get("name")
             }
             ss_names = sorted(list(self._ss_map.keys())) if self._ss_map else []
 
             # 2. Shared Collections
-            cols = client.get_shared_collections()
             # Shared collection objects might have 'name' or 'title' or 'code'
             self._col_map = {}
             for c in cols:
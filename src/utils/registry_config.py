@@ -25,6 +25,7 @@ Author: Synapic Project
 """
 import winreg
 import logging
+from functools import lru_cache
 from typing import Optional, Dict, Any
 
 logger = logging.getLogger(__name__)
@@ -63,7 +64,8 @@ def save_daminion_credentials(url: str, username: str, password: str) -> bool:
             winreg.SetValueEx(key, "URL", 0, winreg.REG_SZ, url)
             winreg.SetValueEx(key, "Username", 0, winreg.REG_SZ, username)
             winreg.SetValueEx(key, "Password", 0, winreg.REG_SZ, password)
-        
+
+        _clear_credentials_cache()
         logger.info(f"Saved Daminion credentials to registry for {url}")
         return True
         
@@ -78,11 +80,32 @@ def load_daminion_credentials() -> Optional[Dict[str, str]]:
     
     Attempts to read the Synapic subkey. If the key or values are missing,
     it returns None instead of raising an error.
+
+    Successful reads (including "no credentials stored") are cached in
+    memory until `save_daminion_credentials` or `delete_daminion_credentials`
+    modifies the registry. Read failures are not cached, so the next call
+    tries the registry again.
     
     Returns:
         Optional[Dict]: A dictionary containing 'url', 'username', and 
                         'password', or None if not found.
     """
+    try:
+        credentials = _read_daminion_credentials()
+    except Exception as e:
+        logger.error(f"Failed to load Daminion credentials from registry: {e}")
+        return None
+    # Hand out a copy so callers cannot mutate the cached entry.
+    return dict(credentials) if credentials is not None else None
+
+
+@lru_cache(maxsize=1)
+def _read_daminion_credentials() -> Optional[Dict[str, str]]:
+    """
+    Read the Daminion subkey from the registry (cached).
+
+    Unexpected errors propagate so that `lru_cache` does not remember them.
+    """
     try:
         with winreg.OpenKey(winreg.HKEY_CURRENT_USER, DAMINION_SUBKEY, 0, winreg.KEY_READ) as key:
             url, _ = winreg.QueryValueEx(key, "URL")
@@ -98,9 +121,6 @@ def load_daminion_credentials() -> Optional[Dict[str, str]]:
     except FileNotFoundError:
         logger.debug("No Daminion credentials found in registry")
         return None
-    except Exception as e:
-        logger.error(f"Failed to load Daminion credentials from registry: {e}")
-        return None
 
 
 def delete_daminion_credentials() -> bool:
@@ -115,9 +135,11 @@ def delete_daminion_credentials() -> bool:
     """
     try:
         winreg.DeleteKey(winreg.HKEY_CURRENT_USER, DAMINION_SUBKEY)
+        _clear_credentials_cache()
         logger.info("Deleted Daminion credentials from registry")
         return True
     except FileNotFoundError:
+        _clear_credentials_cache()
         logger.debug("No Daminion credentials to delete")
         return True
     except Exception as e:
@@ -125,9 +147,14 @@ def delete_daminion_credentials() -> bool:
         return False
 
 
+@lru_cache(maxsize=1)
 def credentials_exist() -> bool:
     """
     Check if Daminion credentials are currently stored in the Registry.
+
+    The result is cached until credentials are saved or deleted, so repeated
+    checks do not reopen the registry key. Errors other than a missing key
+    propagate and are not cached.
     
     Returns:
         bool: True if the Daminion subkey can be opened for reading.
@@ -139,6 +166,12 @@ def credentials_exist() -> bool:
         return False
 
 
+def _clear_credentials_cache() -> None:
+    """Drop cached credential lookups after the registry has been modified."""
+    _read_daminion_credentials.cache_clear()
+    credentials_exist.cache_clear()
+
+
 def save_ui_preferences(preferences: Dict[str, Any]) -> bool:
     """
     Persist lightweight UI preferences to the Windows Registry.
@@ -0,0 +1,133 @@
+"""
+Shared pytest configuration for the Synapic test suite.
+
+Puts the project root on ``sys.path`` once for the whole run so individual
+test modules can import ``src.*`` without adjusting the path themselves, and
+hosts the test doubles that several UI-level tests share.
+"""
+
+import contextlib
+import copy
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, create_autospec
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+
+# -------------------------------------------------------------------------
+# MARKERS
+# -------------------------------------------------------------------------
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "serial: mutates process-global state; cannot run in parallel"
+    )
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run all tests in the group on one xdist worker"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    # Under ``pytest -n auto --dist loadgroup`` every serial test lands on the
+    # same worker; without xdist the extra marker is inert.
+    for item in items:
+        if item.get_closest_marker("serial"):
+            item.add_marker(pytest.mark.xdist_group("serial"))
+
+
+# -------------------------------------------------------------------------
+# UI LIBRARY STUBS
+# -------------------------------------------------------------------------
+
+class MockCTkFrame:
+    """Tiny stand-in base class that satisfies the widget API used by the tests."""
+    def __init__(self, *args, **kwargs): pass
+    def grid(self, *args, **kwargs): pass
+    def pack(self, *args, **kwargs): pass
+    def tkraise(self, *args, **kwargs): pass
+    def winfo_exists(self): return True
+    def after(self, ms, func=None):
+        if func: func()
+        return "timer_id"
+
+
+_UI_STUB_NAMES = (
+    "customtkinter",
+    "tkinter",
+    "tkinter.messagebox",
+    "PIL",
+    "PIL.Image",
+    "PIL.ImageTk",
+)
+
+
+@contextlib.contextmanager
+def ui_stubs():
+    """
+    Swap the windowing libraries for mocks so UI steps import headlessly.
+
+    On exit the original modules are put back and any ``src.ui`` modules
+    imported against the stubs are dropped, so later tests get the real
+    libraries (PIL in particular) and a clean import of the UI package.
+    """
+    saved = {name: sys.modules.get(name) for name in _UI_STUB_NAMES}
+    loaded_before = set(sys.modules)
+
+    ctk_mock = MagicMock()
+    # Define a real class for CTkFrame so inheritance works normally
+    ctk_mock.CTkFrame = MockCTkFrame
+    sys.modules["customtkinter"] = ctk_mock
+    for name in _UI_STUB_NAMES[1:]:
+        sys.modules[name] = MagicMock()
+    try:
+        yield
+    finally:
+        for name, module in saved.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+        for name in set(sys.modules) - loaded_before:
+            if name == "src.ui" or name.startswith("src.ui."):
+                del sys.modules[name]
+
+
+# -------------------------------------------------------------------------
+# CONTROLLER FIXTURES
+# -------------------------------------------------------------------------
+
+@pytest.fixture(scope="session")
+def _controller_template():
+    """
+    Controller mock wired to an authenticated Daminion session, built once.
+
+    The Daminion client is autospecced so calls that do not match the real
+    ``DaminionClient`` API fail; autospec is slow, hence the session scope.
+    """
+    from src.core.daminion_client import DaminionClient
+
+    controller = MagicMock()
+    controller.session = MagicMock()
+    controller.session.datasource = MagicMock()
+    controller.session.datasource.type = "daminion"
+    client = create_autospec(DaminionClient, instance=True)
+    client.authenticated = True
+    controller.session.daminion_client = client
+    return controller
+
+
+@pytest.fixture
+def mock_controller(_controller_template):
+    """
+    Per-test copy of the controller template.
+
+    Tests reassign nested attributes (e.g. ``session.daminion_client``), so a
+    deep copy is needed; it is still cheaper than rebuilding the mock tree.
+    """
+    return copy.deepcopy(_controller_template)
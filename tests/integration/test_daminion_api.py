@@ -3,18 +3,15 @@ Daminion API Test Suite
 
 Comprehensive tests for the new DaminionAPI client (v2.0).
 Run with: python -m pytest tests/ -v
-Or: python tests/test_daminion_api.py
+Or: python -m tests.integration.test_daminion_api
 """
 
 import sys
 import os
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
 import json
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
 from src.core.daminion_api import (
     DaminionAPI,
     DaminionAPIError,
@@ -43,6 +40,19 @@ TEST_DAMINION_PASSWORD = os.environ.get('DAMINION_PASSWORD', 'admin')
 # ============================================================================
 
 
+def _http_response(body: bytes, header_value=None):
+    """
+    Build a lightweight stand-in for the object yielded by ``urlopen``.
+
+    ``Mock(spec_set=...)`` only creates the two attributes ``_make_request``
+    touches, which is much cheaper than a fully populated ``MagicMock``.
+    """
+    response = Mock(spec_set=['read', 'getheader'])
+    response.read.return_value = body
+    response.getheader.return_value = header_value
+    return response
+
+
 class TestDaminionAPIInitialization(unittest.TestCase):
     """Test DaminionAPI initialization and configuration"""
     
@@ -111,13 +121,13 @@ class TestDaminionAPIAuthentication(unittest.TestCase):
     def test_authenticate_success(self, mock_urlopen):
         """Test successful authentication"""
         # Mock successful response
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps({
-            "success": True,
-            "data": {"sessionId": "test123"}
-        }).encode('utf-8')
-        mock_response.getheader.return_value = "sessionId=test123; path=/"
-        mock_urlopen.return_value.__enter__.return_value = mock_response
+        mock_urlopen.return_value.__enter__.return_value = _http_response(
+            json.dumps({
+                "success": True,
+                "data": {"sessionId": "test123"}
+            }).encode('utf-8'),
+            header_value="sessionId=test123; path=/"
+        )
         
         api = DaminionAPI(
             base_url="https://test.daminion.net",
@@ -549,52 +559,66 @@ RUN_INTEGRATION_TESTS = os.environ.get('RUN_INTEGRATION_TESTS', '0') == '1'
 
 @unittest.skipUnless(RUN_INTEGRATION_TESTS, "Integration tests disabled (set RUN_INTEGRATION_TESTS=1 to enable)")
 class TestDaminionAPIIntegration(unittest.TestCase):
-    """Integration tests with real Daminion server"""
+    """Integration tests with real Daminion server
+
+    A single authenticated session is shared by the whole class so the login
+    round trip is paid once per run rather than once per test.
+    """
     
-    def setUp(self):
-        """Set up connection to real server"""
-        self.api = DaminionAPI(
+    @classmethod
+    def setUpClass(cls):
+        """Connect and authenticate once against the real server"""
+        cls.api = DaminionAPI(
             base_url=TEST_DAMINION_URL,
             username=TEST_DAMINION_USERNAME,
             password=TEST_DAMINION_PASSWORD
         )
+        cls.api.__enter__()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Log out of the shared session"""
+        cls.api.__exit__(None, None, None)
     
     def test_real_authentication(self):
-        """Test authentication with real server"""
-        result = self.api.authenticate()
-        self.assertTrue(result)
-        self.assertTrue(self.api.is_authenticated())
+        """Test authentication with real server on a fresh, unshared client"""
+        api = DaminionAPI(
+            base_url=TEST_DAMINION_URL,
+            username=TEST_DAMINION_USERNAME,
+            password=TEST_DAMINION_PASSWORD
+        )
+        try:
+            self.assertTrue(api.authenticate())
+            self.assertTrue(api.is_authenticated())
+        finally:
+            api.logout()
     
     def test_real_get_version(self):
         """Test getting server version"""
-        with self.api:
-            version = self.api.settings.get_version()
-            self.assertIsNotNone(version)
-            self.assertIsInstance(version, str)
-            print(f"Server version: {version}")
+        version = self.api.settings.get_version()
+        self.assertIsNotNone(version)
+        self.assertIsInstance(version, str)
+        print(f"Server version: {version}")
     
     def test_real_get_tags(self):
         """Test getting tag schema from real server"""
-        with self.api:
-            tags = self.api.tags.get_all_tags()
-            self.assertIsNotNone(tags)
-            self.assertGreater(len(tags), 0)
-            print(f"Found {len(tags)} tags")
+        tags = self.api.tags.get_all_tags()
+        self.assertIsNotNone(tags)
+        self.assertGreater(len(tags), 0)
+        print(f"Found {len(tags)} tags")
     
     def test_real_search(self):
         """Test searching on real server"""
-        with self.api:
-            # Simple wildcard search
-            items = self.api.media_items.search(query="*", page_size=5)
-            self.assertIsNotNone(items)
-            print(f"Found {len(items)} items (max 5)")
+        # Simple wildcard search
+        items = self.api.media_items.search(query="*", page_size=5)
+        self.assertIsNotNone(items)
+        print(f"Found {len(items)} items (max 5)")
     
     def test_real_get_collections(self):
         """Test getting collections from real server"""
-        with self.api:
-            collections = self.api.collections.get_all()
-            self.assertIsNotNone(collections)
-            print(f"Found {len(collections)} collections")
+        collections = self.api.collections.get_all()
+        self.assertIsNotNone(collections)
+        print(f"Found {len(collections)} collections")
 
 
 def run_tests():
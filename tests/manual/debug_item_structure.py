@@ -7,12 +7,7 @@ application's parsing logic can be updated confidently when the API shape
 changes.
 """
 
-import sys
 import logging
-from pathlib import Path
-
-# Add src to path
-sys.path.append(str(Path(__file__).parent.parent))
 
 from src.core.daminion_client import DaminionClient
 
@@ -35,7 +30,7 @@ def main():
     
     print(f"\n--- Testing verify_metadata.get_record_metadata for item {item_id} ---")
     try:
-        from tests.verify_metadata import get_record_metadata
+        from tests.integration.verify_metadata import get_record_metadata
         metadata = get_record_metadata(client, item_id)
         print(f"Metadata outcome: {metadata}")
         if metadata:
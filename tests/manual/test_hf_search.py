@@ -6,16 +6,25 @@ Small exploratory script used to observe Hub search results for vision and
 multimodal queries outside the main application UI.
 """
 
-from huggingface_hub import list_models
+import functools
 import logging
 
 logging.basicConfig(level=logging.INFO)
 
+
+@functools.lru_cache(maxsize=64)
+def _cached_list_models(query, task, limit, sort, direction):
+    """Return Hub model IDs for a search, memoized for the process lifetime."""
+    # Imported lazily so loading this module does not pull in huggingface_hub.
+    from huggingface_hub import list_models
+    models = list_models(filter=task, search=query, limit=limit, sort=sort, direction=direction)
+    return tuple(m.id for m in models)
+
+
 def test_search(query, task=None):
     print(f"\n--- Searching for '{query}' (Task: {task}) ---")
     try:
-        models = list_models(filter=task, search=query, limit=10, sort="downloads", direction=-1)
-        found = [m.id for m in models]
+        found = list(_cached_list_models(query, task, 10, "downloads", -1))
         print(f"Found {len(found)} models: {found}")
     except Exception as e:
         print(f"Error: {e}")
@@ -6,19 +6,38 @@ Developer script for validating image-size assumptions or resize behavior while
 debugging image processing edge cases.
 """
 
-import sys
-import os
-from pathlib import Path
-
-# Add project root to sys.path
-root = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(root))
-
 from src.core.huggingface_utils import get_remote_model_size, format_size
+from src.utils.concurrency import DaemonThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+import json
 import logging
 
 logging.basicConfig(level=logging.INFO)
 
+# Sizes seen on previous runs today, keyed by "<model_id>|<ISO date>" so the
+# Hub is only asked again once a day.
+_CACHE_FILE = Path(".verify_cache.json")
+
+def _load_cache():
+    try:
+        return json.loads(_CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+def _save_cache(cache):
+    try:
+        _CACHE_FILE.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+    except OSError as e:
+        logging.warning(f"Could not write {_CACHE_FILE}: {e}")
+
+def _probe_size(mid):
+    """Return the remote size for ``mid``, or the exception raised fetching it."""
+    try:
+        return get_remote_model_size(mid)
+    except Exception as e:
+        return e
+
 def verify_models():
     test_models = [
         "timm/resnet18.fb_swsl_iglb_ft_in1k",
@@ -28,14 +47,34 @@ def verify_models():
     
     print("\nVerifying Model Sizes after Fix:")
     print("-" * 50)
+    today = date.today().isoformat()
+    # Entries from earlier days are stale; drop them on load
+    cache = {k: v for k, v in _load_cache().items() if k.endswith(f"|{today}")}
+    sizes = {
+        mid: cache[f"{mid}|{today}"]
+        for mid in test_models
+        if f"{mid}|{today}" in cache
+    }
+    missing = [mid for mid in test_models if mid not in sizes]
+
+    # The probes are independent network calls, so issue them all at once
+    if missing:
+        with DaemonThreadPoolExecutor(max_workers=len(missing)) as executor:
+            sizes.update(zip(missing, executor.map(_probe_size, missing)))
+        for mid in missing:
+            # 0 or an exception means the lookup failed; only cache real sizes
+            if isinstance(sizes[mid], int) and sizes[mid] > 0:
+                cache[f"{mid}|{today}"] = sizes[mid]
+        _save_cache(cache)
+
     for mid in test_models:
-        try:
-            size = get_remote_model_size(mid)
-            print(f"Model: {mid:<40} | Size: {format_size(size)}")
-            if size == 0:
-                print(f"  FAILED: Size is still 0 for {mid}")
-        except Exception as e:
-            print(f"  ERROR for {mid}: {e}")
+        size = sizes[mid]
+        if isinstance(size, Exception):
+            print(f"  ERROR for {mid}: {size}")
+            continue
+        print(f"Model: {mid:<40} | Size: {format_size(size)}")
+        if size == 0:
+            print(f"  FAILED: Size is still 0 for {mid}")
 
 if __name__ == "__main__":
     verify_models()
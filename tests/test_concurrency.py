@@ -12,11 +12,6 @@ window while asynchronous work is still pending.
 
 import unittest
 import threading
-import sys
-import os
-
-# Ensure src is in path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.utils.concurrency import DaemonThreadPoolExecutor
 
@@ -39,9 +34,10 @@ class TestDaemonThreadPoolExecutor(unittest.TestCase):
             return threading.current_thread().daemon
             
         with DaemonThreadPoolExecutor(max_workers=2) as executor:
-            results = list(executor.map(check_daemon_arg, [1, 2, 3]))
-            for is_daemon in results:
-                self.assertTrue(is_daemon, "Mapped worker thread should be a daemon thread")
+            self.assertTrue(
+                all(executor.map(check_daemon_arg, [1, 2, 3])),
+                "Mapped worker thread should be a daemon thread",
+            )
 
 if __name__ == '__main__':
     unittest.main()
@@ -6,11 +6,13 @@ This module checks that provider integrations surface useful failures and emit
 enough information for debugging and operational support.
 """
 
-import unittest
-from urllib.error import HTTPError, URLError
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-import sys, os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+import pytest
+from urllib.error import HTTPError, URLError
 
 from src.core.daminion_api import DaminionAPI, DaminionAuthenticationError, DaminionNotFoundError, DaminionRateLimitError, DaminionNetworkError
 
@@ -30,66 +32,108 @@ class _DummyResponse:
         return False
 
 
-def _fake_context_manager(resp: _DummyResponse):
-    class CM:
-        def __enter__(self_inner):
-            return resp
-        def __exit__(self_inner, exc_type, exc, tb):
-            return False
-    return CM()
-
-
-class TestApiErrorPaths(unittest.TestCase):
-    def setUp(self):
-        self.api = DaminionAPI(base_url="https://example.net", username="u", password="p")
-        self.api._authenticated = True
-
-    def test_authentication_error_mapping(self):
-        from urllib import request
-        def _raise(*args, **kwargs):
-            raise HTTPError(url="https://example/api", code=401, msg="Unauthorized", hdrs=None, fp=None)
-        request.urlopen = _raise  # type: ignore
-        with self.assertRaises(DaminionAuthenticationError):
-            self.api._make_request("/api/test")
-
-    def test_not_found_error_mapping(self):
-        from urllib import request
-        def _raise(*args, **kwargs):
-            raise HTTPError(url="https://example/api", code=404, msg="Not Found", hdrs=None, fp=None)
-        request.urlopen = _raise  # type: ignore
-        with self.assertRaises(DaminionNotFoundError):
-            self.api._make_request("/api/test")
-
-    def test_rate_limit_error_mapping(self):
-        from urllib import request
-        def _raise(*args, **kwargs):
-            raise HTTPError(url="https://example/api", code=429, msg="Too Many Requests", hdrs=None, fp=None)
-        request.urlopen = _raise  # type: ignore
-        with self.assertRaises(DaminionRateLimitError):
-            self.api._make_request("/api/test")
-
-    def test_network_error_mapping(self):
-        from urllib import request
-        def _raise(*args, **kwargs):
-            raise URLError("Network down")
-        request.urlopen = _raise  # type: ignore
-        with self.assertRaises(DaminionNetworkError):
-            self.api._make_request("/api/test")
-
-    def test_observability_counter_increments(self):
-        import json
-        # Prepare a dummy successful JSON response
-        content = json.dumps({"success": True, "data": {}}).encode('utf-8')
-        self.api._authenticated = True
-        from urllib import request
-        def _ok(*args, **kwargs):
-            return _fake_context_manager(_DummyResponse(content))
-        request.urlopen = _ok  # type: ignore
-        data = self.api._make_request("/api/test", skip_auth=False, skip_rate_limit=True)
-        # Ensure that a request was counted
-        self.assertTrue(hasattr(self.api, 'get_request_count'))
-        self.assertIsInstance(self.api.get_request_count(), int)
+class _ResponseContext:
+    """Reusable stand-in for the object ``urlopen`` returns in a ``with`` block."""
+    def __init__(self, resp: _DummyResponse):
+        self._resp = resp
+    def __enter__(self):
+        return self._resp
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+# Deterministic success payload, built once for the module
+_CACHED_CONTENT = json.dumps({"success": True, "data": {}}).encode('utf-8')
+_CACHED_RESP = _DummyResponse(_CACHED_CONTENT)
+_CACHED_CM = _ResponseContext(_CACHED_RESP)
+
+
+@pytest.fixture(scope="class")
+def _shared_api():
+    return DaminionAPI(base_url="https://example.net", username="u", password="p")
+
 
+@pytest.fixture
+def api(_shared_api):
+    # A 401 clears the flag, so restore it for every test
+    _shared_api._authenticated = True
+    return _shared_api
 
-if __name__ == '__main__':
-    unittest.main()
+
+class _YieldingInt(int):
+    """Counter value whose ``+`` sleeps, splitting ``+= 1`` into a racy read and write."""
+    def __add__(self, other):
+        time.sleep(0.001)
+        return _YieldingInt(int(self) + other)
+
+
+class _YieldingDict(dict):
+    """Latency store whose ``setdefault`` sleeps between the lookup and the insert."""
+    def setdefault(self, key, default=None):
+        if key not in self:
+            time.sleep(0.01)
+            self[key] = default
+        return self[key]
+
+
+def _raising(exc):
+    def _raise(*args, **kwargs):
+        raise exc
+    return _raise
+
+
+@pytest.mark.serial
+class TestApiErrorPaths:
+    @pytest.mark.parametrize("code, msg, expected", [
+        (401, "Unauthorized", DaminionAuthenticationError),
+        (404, "Not Found", DaminionNotFoundError),
+        (429, "Too Many Requests", DaminionRateLimitError),
+    ])
+    def test_http_error_mapping(self, api, monkeypatch, code, msg, expected):
+        error = HTTPError(url="https://example/api", code=code, msg=msg, hdrs=None, fp=None)
+        monkeypatch.setattr("urllib.request.urlopen", _raising(error))
+        with pytest.raises(expected):
+            api._make_request("/api/test")
+
+    def test_network_error_mapping(self, api, monkeypatch):
+        monkeypatch.setattr("urllib.request.urlopen", _raising(URLError("Network down")))
+        with pytest.raises(DaminionNetworkError):
+            api._make_request("/api/test")
+
+    def test_observability_counter_increments(self, api, monkeypatch):
+        def _ok(*args, **kwargs):
+            return _CACHED_CM
+        monkeypatch.setattr("urllib.request.urlopen", _ok)
+        data = api._make_request("/api/test", skip_auth=False, skip_rate_limit=True)
+        # Ensure that a request was counted
+        assert hasattr(api, 'get_request_count')
+        assert isinstance(api.get_request_count(), int)
+
+    def test_concurrent_requests_keep_metrics_consistent(self, api, monkeypatch):
+        # No "data" field, so every successful call records a latency sample
+        resp_cm = _ResponseContext(_DummyResponse(b'{"success": true}'))
+        monkeypatch.setattr("urllib.request.urlopen", lambda *args, **kwargs: resp_cm)
+        api.reset_metrics()
+        # Widen the read-modify-write windows so a missing lock loses updates
+        api._request_count = _YieldingInt(0)
+        api._latency_by_endpoint = _YieldingDict()
+
+        workers, per_worker = 8, 25
+        start = threading.Barrier(workers)
+
+        def _worker(_):
+            start.wait()
+            for _ in range(per_worker):
+                api._make_request("/api/test", skip_rate_limit=True)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_worker, range(workers)))
+
+        assert api.get_request_count() == workers * per_worker
+        assert len(api._latency_by_endpoint["/api/test"]) == workers * per_worker
+
+def test_build_url_encodes_equal_hashing_values_distinctly(_shared_api):
+    # 1, True and 1.0 compare equal, so each must be encoded from its own value
+    assert _shared_api._build_url("/api/test", {"f": 1}).endswith("?f=1")
+    assert _shared_api._build_url("/api/test", {"f": True}).endswith("?f=True")
+    assert _shared_api._build_url("/api/test", {"f": 1.0}).endswith("?f=1.0")
@@ -6,15 +6,20 @@ These tests verify that API-related counters or usage information are computed
 and exposed consistently.
 """
 
-import unittest
 import json
 
+import pytest
+
 from src.core.daminion_api import DaminionAPI
 
 
-class TestApiMetrics(unittest.TestCase):
-    def test_metrics_snapshot_structure(self):
-        api = DaminionAPI(base_url="https://example.net", username="u", password="p")
+@pytest.fixture(scope="class")
+def api():
+    return DaminionAPI(base_url="https://example.net", username="u", password="p")
+
+
+class TestApiMetrics:
+    def test_metrics_snapshot_structure(self, api):
         # simulate some state
         api._request_count = 5
         api._latency_by_endpoint = {
@@ -23,25 +28,16 @@ class TestApiMetrics(unittest.TestCase):
         }
         api._error_counts = {'URLError': 1}
 
+        expected_types = {'requests': int, 'latency_ms_by_endpoint': dict, 'errors': dict}
         metrics = api.get_metrics()
-        self.assertIn('requests', metrics)
-        self.assertIn('latency_ms_by_endpoint', metrics)
-        self.assertIn('errors', metrics)
-        self.assertIsInstance(metrics['requests'], int)
-        self.assertIsInstance(metrics['latency_ms_by_endpoint'], dict)
-        self.assertIsInstance(metrics['errors'], dict)
-
-    def test_metrics_json_export(self):
-        api = DaminionAPI(base_url="https://example.net", username="u", password="p")
+        assert all(isinstance(metrics.get(k), t) for k, t in expected_types.items()), metrics
+
+    def test_metrics_json_export(self, api):
         api._request_count = 2
         api._latency_by_endpoint = {'/a': [1.0]}
         api._error_counts = {}
 
-        json_str = api.get_metrics().__class__
         # Simple sanity: ensure dumping to JSON works
-        s = json.dumps(api.get_metrics())
-        self.assertIsInstance(s, str)
-
-
-if __name__ == '__main__':
-    unittest.main()
+        metrics = api.get_metrics()
+        s = json.dumps(metrics)
+        assert isinstance(s, str)
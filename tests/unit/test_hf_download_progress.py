@@ -1,13 +1,8 @@
-import os
 import queue
-import sys
 import unittest
 from types import SimpleNamespace
 from unittest.mock import patch
 
-
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
-
 from src.core import huggingface_utils
 
 
@@ -7,28 +7,75 @@ must be released promptly to keep the desktop application stable over long
 batch-processing runs.
 """
 
-import unittest
-from unittest.mock import patch, MagicMock, PropertyMock
-import sys
-import os
+import importlib
+import logging
+from collections import deque
+from pathlib import Path
+from unittest.mock import patch, MagicMock
 
-# Add src to path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+import pytest
+
+
+# Imported lazily so collecting this module does not pull in the whole
+# processing pipeline (API clients, image processing, model helpers).
+@pytest.fixture(scope="module")
+def processing_mod():
+    return importlib.import_module("src.core.processing")
+
+
+@pytest.fixture(scope="module")
+def session_cls():
+    return importlib.import_module("src.core.session").Session
+
+
+def _bare_session(**engine_attrs):
+    """
+    Build a Session without running ``Session.__init__``.
+
+    Only the state ``_run_job`` touches is set. The engine is a real
+    ``EngineConfig`` (its defaults cover the many fields the job reads) with
+    ``engine_attrs`` applied on top.
+    """
+    from src.core.session import DatasourceConfig, EngineConfig, Session
+
+    session = Session.__new__(Session)
+    session.logger = logging.getLogger(Session.__module__)
+    session.datasource = DatasourceConfig()
+    session.engine = EngineConfig(**engine_attrs)
+    session.daminion_client = None
+    session.is_processing = False
+    session.total_items = session.processed_items = session.failed_items = 0
+    session.results = deque(maxlen=500)
+    return session
 
-from src.core.processing import ProcessingManager
-from src.core.session import Session
-from collections import deque
 
+# Well-formed model reply so items run through the full tagging path
+_CHAT_REPLY = '{"description":"test","category":"Test","keywords":["a"]}'
 
-class TestMemoryCleanup(unittest.TestCase):
+
+@pytest.fixture
+def mk_manager(processing_mod):
+    """Factory returning ``(manager, client)`` for an API-provider job."""
+    def _mk(provider, **engine_attrs):
+        session = _bare_session(provider=provider, **engine_attrs)
+        manager = processing_mod.ProcessingManager(session, MagicMock(), MagicMock())
+        client = MagicMock()
+        client.is_available.return_value = True
+        client.chat_with_image.return_value = _CHAT_REPLY
+        return manager, client
+    return _mk
+
+
+class TestMemoryCleanup:
     """Tests for memory cleanup in the processing pipeline."""
 
+    @pytest.mark.parametrize("device,patch_cuda", [("cpu", False), ("cuda", True)])
     @patch('src.core.processing.gc.collect')
-    def test_cleanup_after_local_job(self, mock_gc_collect):
+    def test_cleanup_after_local_job(self, mock_gc_collect, device, patch_cuda,
+                                     processing_mod):
         """Model is unloaded and gc.collect called after local job."""
-        session = Session()
-        session.engine.provider = "local"
-        session.engine.device = "cpu"  # Avoid CUDA path which imports torch locally
+        ProcessingManager = processing_mod.ProcessingManager
+        session = _bare_session(provider="local", device=device)
 
         log_cb = MagicMock()
         prog_cb = MagicMock()
@@ -36,29 +83,29 @@ class TestMemoryCleanup(unittest.TestCase):
         manager = ProcessingManager(session, log_cb, prog_cb)
         manager.model = MagicMock()  # Simulate loaded model
 
-        with patch.object(ProcessingManager, '_fetch_items', return_value=[]), \
+        # The CUDA path imports torch locally; swap in a fake module
+        fake_torch = MagicMock()
+        fake_torch.cuda.is_available.return_value = True
+        modules = {"torch": fake_torch} if patch_cuda else {}
+
+        with patch.dict("sys.modules", modules), \
+             patch.object(ProcessingManager, '_fetch_items', return_value=[]), \
              patch.object(ProcessingManager, '_init_local_model'):
             manager._run_job()
 
         # Verify model unloaded
-        self.assertIsNone(manager.model)
+        assert manager.model is None
         # Verify gc.collect called at end of job
         mock_gc_collect.assert_called()
+        if patch_cuda:
+            fake_torch.cuda.empty_cache.assert_called_once()
 
     @patch('src.core.processing.gc.collect')
-    def test_api_client_created_once_and_closed(self, mock_gc_collect):
+    def test_api_client_created_once_and_closed(self, mock_gc_collect,
+                                                processing_mod, mk_manager):
         """API client is created once in _run_job and closed after job completes."""
-        session = Session()
-        session.engine.provider = "nvidia"
-        session.engine.nvidia_api_key = "test-key-123"
-
-        log_cb = MagicMock()
-        prog_cb = MagicMock()
-
-        manager = ProcessingManager(session, log_cb, prog_cb)
-
-        mock_client = MagicMock()
-        mock_client.is_available.return_value = True
+        ProcessingManager = processing_mod.ProcessingManager
+        manager, mock_client = mk_manager("nvidia", nvidia_api_key="test-key-123")
 
         with patch('src.core.processing.NvidiaClient', return_value=mock_client) as MockClass, \
              patch.object(ProcessingManager, '_fetch_items', return_value=[]):
@@ -69,31 +116,22 @@ class TestMemoryCleanup(unittest.TestCase):
         # Client closed at end of job
         mock_client.close.assert_called_once()
         # API client reference cleared
-        self.assertIsNone(manager._api_client)
+        assert manager._api_client is None
         # gc.collect called
         mock_gc_collect.assert_called()
 
     @patch('src.core.processing.gc.collect')
-    def test_periodic_gc_collect_per_item(self, mock_gc_collect):
+    def test_periodic_gc_collect_per_item(self, mock_gc_collect,
+                                          processing_mod, mk_manager):
         """gc.collect is called periodically during item processing."""
-        session = Session()
-        session.engine.provider = "nvidia"
-        session.engine.nvidia_api_key = "test-key-123"
+        ProcessingManager = processing_mod.ProcessingManager
+        manager, mock_client = mk_manager("nvidia", nvidia_api_key="test-key-123")
 
-        log_cb = MagicMock()
-        prog_cb = MagicMock()
-
-        manager = ProcessingManager(session, log_cb, prog_cb)
-
-        mock_client = MagicMock()
-        mock_client.is_available.return_value = True
-        mock_client.chat_with_image.return_value = '{"description":"test","category":"Test","keywords":["a"]}'
+        # Shrink the interval so two items are enough to hit a checkpoint
+        fake_items = [Path(f"fake_{i}.jpg") for i in range(2)]
 
-        # Create 6 fake items (triggers gc.collect at items 3 and 6 with new interval)
-        from pathlib import Path
-        fake_items = [Path(f"fake_{i}.jpg") for i in range(6)]
-
-        with patch('src.core.processing.NvidiaClient', return_value=mock_client), \
+        with patch('src.core.processing.GC_ITEM_INTERVAL', 2), \
+             patch('src.core.processing.NvidiaClient', return_value=mock_client), \
              patch.object(ProcessingManager, '_fetch_items', return_value=fake_items), \
              patch('src.core.processing.image_processing') as mock_ip, \
              patch('src.core.processing.Image'):
@@ -101,27 +139,17 @@ class TestMemoryCleanup(unittest.TestCase):
             mock_ip.write_metadata.return_value = True
             manager._run_job()
 
-        # gc.collect should have been called multiple times:
-        # at items 3 and 6 (every 3 items), plus once at end of job
-        self.assertGreaterEqual(mock_gc_collect.call_count, 3)
+        # gc.collect should have been called at item 2 (every 2 items),
+        # plus once at end of job
+        assert mock_gc_collect.call_count >= 2
 
     @patch('src.core.processing.gc.collect')
-    def test_groq_client_reused_across_items(self, mock_gc_collect):
+    def test_groq_client_reused_across_items(self, mock_gc_collect,
+                                             processing_mod, mk_manager):
         """Groq client is created once and reused, not per-item."""
-        session = Session()
-        session.engine.provider = "groq_package"
-        session.engine.groq_api_keys = "test-key-123"
+        ProcessingManager = processing_mod.ProcessingManager
+        manager, mock_client = mk_manager("groq_package", groq_api_keys="test-key-123")
 
-        log_cb = MagicMock()
-        prog_cb = MagicMock()
-
-        manager = ProcessingManager(session, log_cb, prog_cb)
-
-        mock_client = MagicMock()
-        mock_client.is_available.return_value = True
-        mock_client.chat_with_image.return_value = '{"description":"test","category":"Test","keywords":["a"]}'
-
-        from pathlib import Path
         fake_items = [Path(f"fake_{i}.jpg") for i in range(3)]
 
         with patch('src.core.processing.GroqPackageClient', return_value=mock_client) as MockClass, \
@@ -137,35 +165,31 @@ class TestMemoryCleanup(unittest.TestCase):
         # Client closed at end
         mock_client.close.assert_called_once()
 
-    def test_session_results_bounded(self):
+    def test_session_results_bounded(self, session_cls):
         """Session results list is bounded to prevent unbounded growth."""
-        session = Session()
-        
+        session = session_cls()
+
         # Verify results is a deque with maxlen
-        self.assertIsInstance(session.results, deque)
-        self.assertEqual(session.results.maxlen, 500)
-        
+        assert isinstance(session.results, deque)
+        assert session.results.maxlen == 500
+
         # Fill beyond capacity
         for i in range(600):
             session.results.append({"filename": f"test_{i}.jpg", "status": "Success", "tags": "test"})
-        
+
         # Should be capped at 500
-        self.assertEqual(len(session.results), 500)
+        assert len(session.results) == 500
         # Oldest items should have been dropped
-        self.assertEqual(session.results[0]["filename"], "test_100.jpg")
+        assert session.results[0]["filename"] == "test_100.jpg"
 
-    def test_session_results_reset_preserves_bound(self):
+    def test_session_results_reset_preserves_bound(self, session_cls):
         """reset_stats creates a fresh bounded deque."""
-        session = Session()
+        session = session_cls()
         session.results.append({"filename": "test.jpg", "status": "Success", "tags": "test"})
-        
-        session.reset_stats()
-        
-        # Results should be empty but still bounded
-        self.assertEqual(len(session.results), 0)
-        self.assertIsInstance(session.results, deque)
-        self.assertEqual(session.results.maxlen, 500)
 
+        session.reset_stats()
 
-if __name__ == '__main__':
-    unittest.main()
+        # Results should be empty but still bounded
+        assert len(session.results) == 0
+        assert isinstance(session.results, deque)
+        assert session.results.maxlen == 500
@@ -6,50 +6,106 @@ This suite verifies the rules used to derive model-loading arguments for local
 inference, especially around hardware and compatibility constraints.
 """
 
-import unittest
-from unittest.mock import patch, MagicMock
-import sys
 import os
+import unittest
+from unittest.mock import patch, MagicMock, DEFAULT
 
-# Add src to path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+import torch
 
 from src.core import huggingface_utils
 
 class TestModelLoadingParams(unittest.TestCase):
-    @patch('src.core.huggingface_utils.pipeline')
-    @patch('src.core.huggingface_utils.snapshot_download')
-    @patch('src.core.huggingface_utils.is_model_downloaded')
-    @patch('src.core.huggingface_utils.os.path.exists')
-    def test_load_model_optimizations(self, mock_exists, mock_downloaded, mock_snapshot, mock_pipeline):
-        mock_exists.return_value = True
-        mock_downloaded.return_value = True
-        
+    @classmethod
+    def setUpClass(cls):
+        # Patch the loader's collaborators once for the class, not per test.
+        # A resolved snapshot path means load_model never touches the HF cache.
+        cls._hf_patcher = patch.multiple(
+            'src.core.huggingface_utils',
+            pipeline=DEFAULT,
+            AutoProcessor=DEFAULT,
+            _resolved_model_path=MagicMock(return_value="/fake/snapshots/abc123"),
+        )
+        cls.mock_pipeline = cls._hf_patcher.start()['pipeline']
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._hf_patcher.stop()
+
+    def setUp(self):
+        self.mock_pipeline.reset_mock()
+        env_patcher = patch.dict(os.environ)
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+        os.environ.pop("SYNAPIC_LOW_CPU_MEM", None)
+
+    def test_load_model_optimizations(self):
         huggingface_utils.load_model("test-model", "image-to-text", device=0)
         
         # Verify pipeline was called with optimizations
-        args, kwargs = mock_pipeline.call_args
-        self.assertEqual(kwargs.get('low_cpu_mem_usage'), True)
-        self.assertEqual(kwargs.get('torch_dtype'), "auto")
+        args, kwargs = self.mock_pipeline.call_args
+        self.assertIs(kwargs['model_kwargs'].get('low_cpu_mem_usage'), True)
+        self.assertEqual(kwargs.get('torch_dtype'), torch.float16)
         self.assertEqual(kwargs.get('device_map'), "auto")
         self.assertIsNone(kwargs.get('device'))
 
-    @patch('src.core.huggingface_utils.pipeline')
-    @patch('src.core.huggingface_utils.snapshot_download')
-    @patch('src.core.huggingface_utils.is_model_downloaded')
-    @patch('src.core.huggingface_utils.os.path.exists')
-    def test_load_model_cpu_params(self, mock_exists, mock_downloaded, mock_snapshot, mock_pipeline):
-        mock_exists.return_value = True
-        mock_downloaded.return_value = True
-        
+    def test_load_model_cpu_params(self):
         huggingface_utils.load_model("test-model", "image-to-text", device=-1)
         
-        # Verify pipeline was called with optimizations but NO device_map for CPU
-        args, kwargs = mock_pipeline.call_args
-        self.assertEqual(kwargs.get('low_cpu_mem_usage'), True)
-        self.assertEqual(kwargs.get('torch_dtype'), "auto")
+        # Verify pipeline was called with optimizations but NO device_map for CPU;
+        # low_cpu_mem_usage only slows CPU loads, so it is off by default there
+        args, kwargs = self.mock_pipeline.call_args
+        self.assertIs(kwargs['model_kwargs'].get('low_cpu_mem_usage'), False)
+        self.assertEqual(kwargs.get('torch_dtype'), torch.float32)
         self.assertIsNone(kwargs.get('device_map'))
         self.assertEqual(kwargs.get('device'), -1)
 
+    def test_load_model_compile_enabled(self):
+        with patch('src.core.huggingface_utils.torch.compile') as mock_compile:
+            model = huggingface_utils.load_model(
+                "test-model", "image-to-text", device=0, compile_model=True
+            )
+
+        pipe = self.mock_pipeline.return_value
+        self.assertIs(model, pipe)
+        mock_compile.assert_called_once()
+        self.assertEqual(mock_compile.call_args.kwargs.get('mode'), "reduce-overhead")
+        self.assertIs(pipe.model, mock_compile.return_value)
+
+    def test_load_model_compile_disabled_by_default(self):
+        with patch('src.core.huggingface_utils.torch.compile') as mock_compile:
+            huggingface_utils.load_model("test-model", "image-to-text", device=0)
+
+        mock_compile.assert_not_called()
+
+    def test_low_cpu_mem_env_override(self):
+        os.environ["SYNAPIC_LOW_CPU_MEM"] = "1"
+        huggingface_utils.load_model("test-model", "image-to-text", device=-1)
+
+        args, kwargs = self.mock_pipeline.call_args
+        self.assertIs(kwargs['model_kwargs'].get('low_cpu_mem_usage'), True)
+
+class TestResolvedModelPath(unittest.TestCase):
+    def setUp(self):
+        cache_patcher = patch.dict(huggingface_utils._RESOLVED_MODEL_PATHS, clear=True)
+        cache_patcher.start()
+        self.addCleanup(cache_patcher.stop)
+
+    @patch('src.core.huggingface_utils.os.path.isdir', return_value=True)
+    @patch('src.core.huggingface_utils._get_latest_snapshot_path', return_value="/fake/snapshots/abc123")
+    @patch('src.core.huggingface_utils.is_model_downloaded', return_value=True)
+    def test_repeat_lookup_skips_download_check(self, mock_downloaded, mock_latest, mock_isdir):
+        first = huggingface_utils._resolved_model_path("test-model")
+        second = huggingface_utils._resolved_model_path("test-model")
+
+        self.assertEqual(first, "/fake/snapshots/abc123")
+        self.assertEqual(second, first)
+        mock_downloaded.assert_called_once()
+
+    @patch('src.core.huggingface_utils.is_model_downloaded', return_value=False)
+    def test_missing_model_is_not_remembered(self, mock_downloaded):
+        self.assertIsNone(huggingface_utils._resolved_model_path("test-model"))
+        self.assertIsNone(huggingface_utils._resolved_model_path("test-model"))
+        self.assertEqual(mock_downloaded.call_count, 2)
+
 if __name__ == '__main__':
     unittest.main()
@@ -6,57 +6,96 @@ These tests exercise the NVIDIA provider wrapper so request formatting,
 availability checks, and response handling stay predictable.
 """
 
+import base64
+import os
+import shutil
+import tempfile
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, DEFAULT
 from src.integrations.nvidia_client import NvidiaClient
 
+# Response payloads are plain data shared by all tests; each test wraps them
+# in a fresh response mock so configuring one never leaks into another.
+_LIST_MODELS_PAYLOAD = {
+    "data": [
+        {"id": "mistralai/mistral-large-3-675b-instruct-2512"},
+        {"id": "nvidia/llama-3.1-405b-instruct"}
+    ]
+}
+
+_CHAT_PAYLOAD = {
+    "choices": [
+        {
+            "message": {
+                "content": '{"description": "A beautiful landscape", "category": "Nature", "keywords": ["mountains", "lake"]}'
+            }
+        }
+    ]
+}
+
+
+def _response(payload):
+    """Build a new 200 response mock whose json() returns ``payload``."""
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.json.return_value = payload
+    return resp
+
+
 class TestNvidiaClient(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # One patcher for the whole class instead of a @patch per test
+        cls._session_patcher = patch.multiple(
+            'src.integrations.nvidia_client.requests.Session', get=DEFAULT, post=DEFAULT
+        )
+        mocks = cls._session_patcher.start()
+        cls.mock_get = mocks['get']
+        cls.mock_post = mocks['post']
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._session_patcher.stop()
+
     def setUp(self):
+        self.mock_get.reset_mock(return_value=True, side_effect=True)
+        self.mock_post.reset_mock(return_value=True, side_effect=True)
         self.api_key = "test_key"
         self.client = NvidiaClient(api_key=self.api_key)
 
-    @patch('src.integrations.nvidia_client.requests.Session.get')
-    def test_list_models(self, mock_get):
+    def test_list_models(self):
         # Mock response for listing models
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {
-            "data": [
-                {"id": "mistralai/mistral-large-3-675b-instruct-2512"},
-                {"id": "nvidia/llama-3.1-405b-instruct"}
-            ]
-        }
-        mock_get.return_value = mock_resp
+        self.mock_get.return_value = _response(_LIST_MODELS_PAYLOAD)
 
         models = self.client.list_models()
         self.assertEqual(len(models), 2)
         self.assertEqual(models[0]['id'], "mistralai/mistral-large-3-675b-instruct-2512")
         self.assertEqual(models[0]['provider'], "Nvidia")
 
-    @patch('src.integrations.nvidia_client.requests.Session.post')
-    @patch('os.path.exists')
-    @patch('builtins.open', new_callable=unittest.mock.mock_open, read_data=b"fake_image_data")
-    def test_chat_with_image(self, mock_file, mock_exists, mock_post):
-        mock_exists.return_value = True
-        
+    def _write_image(self, data: bytes) -> str:
+        """Write ``data`` to a real temporary PNG and return its path."""
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir, ignore_errors=True)
+        path = os.path.join(tmp_dir, "test.png")
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def _sent_content(self) -> str:
+        args, kwargs = self.mock_post.call_args
+        return kwargs['json']['messages'][0]['content']
+
+    def test_chat_with_image(self):
+        image_path = self._write_image(b"fake_image_data")
+
         # Mock response for chat completion
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {
-            "choices": [
-                {
-                    "message": {
-                        "content": '{"description": "A beautiful landscape", "category": "Nature", "keywords": ["mountains", "lake"]}'
-                    }
-                }
-            ]
-        }
-        mock_post.return_value = mock_resp
+        mock_post = self.mock_post
+        mock_post.return_value = _response(_CHAT_PAYLOAD)
 
         response = self.client.chat_with_image(
             model_name="mistralai/mistral-large-3-675b-instruct-2512",
             prompt="Analyze this image",
-            image_path="test.png"
+            image_path=image_path
         )
 
         self.assertIn("description", response)
@@ -68,7 +107,32 @@ class TestNvidiaClient(unittest.TestCase):
         payload = kwargs['json']
         self.assertEqual(payload['model'], "mistralai/mistral-large-3-675b-instruct-2512")
         self.assertTrue(payload['messages'][0]['content'].startswith("Analyze this image"))
-        self.assertIn("data:image/png;base64,", payload['messages'][0]['content'])
+        expected_b64 = base64.b64encode(b"fake_image_data").decode()
+        self.assertIn(f"data:image/png;base64,{expected_b64}\"", payload['messages'][0]['content'])
+
+    def test_chat_with_empty_image(self):
+        # mmap refuses zero-byte files, so this exercises the empty-file branch
+        image_path = self._write_image(b"")
+        self.mock_post.return_value = _response(_CHAT_PAYLOAD)
+
+        self.client.chat_with_image(
+            model_name="mistralai/mistral-large-3-675b-instruct-2512",
+            prompt="Analyze this image",
+            image_path=image_path
+        )
+
+        self.assertIn('data:image/png;base64,"', self._sent_content())
+
+    def test_chat_with_missing_image(self):
+        # Stub only the client's own existence check, not os.path.exists globally
+        with patch.object(self.client, '_image_exists', return_value=False):
+            with self.assertRaises(FileNotFoundError):
+                self.client.chat_with_image(
+                    model_name="mistralai/mistral-large-3-675b-instruct-2512",
+                    prompt="Analyze this image",
+                    image_path="missing.png"
+                )
+        self.mock_post.assert_not_called()
 
 if __name__ == '__main__':
     unittest.main()
@@ -9,49 +9,71 @@ Verifies that:
 3. When auto_paginate=False, get_items_filtered is called exactly once regardless
    of page size.
 4. The infinite-loop guard stops processing if the same item IDs are returned twice.
-5. get_items_filtered itself always returns at most one batch (single_page=True fix).
+5. The next item's image download is prefetched while the current item is processed.
+6. get_items_filtered itself always returns at most one batch (single_page=True fix).
 """
 
-import sys
-import os
+import copy
+import threading
 import unittest
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch, call
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+import pytest
 
 from src.core.processing import ProcessingManager
 
 
+# Built once; tests take slices instead of rebuilding dicts on every fetch.
+# Large enough for four distinct 500-item pages. The items must stay real
+# dicts (not e.g. numpy records): ProcessingManager tells Daminion items from
+# local paths with isinstance(item, dict) and reads them via item.get().
+_ITEMS_POOL = tuple({"id": i, "fileName": f"img_{i}.jpg"} for i in range(2048))
+
+
 def _make_dummy_items(count: int, id_offset: int = 0):
-    """Return a list of minimal Daminion item dicts with unique IDs."""
-    return [{"id": id_offset + i, "fileName": f"img_{id_offset + i}.jpg"} for i in range(count)]
+    """Return minimal Daminion item dicts with unique IDs (a slice of the pool)."""
+    assert id_offset + count <= len(_ITEMS_POOL), "enlarge _ITEMS_POOL"
+    return _ITEMS_POOL[id_offset:id_offset + count]
 
 
 def _make_manager(auto_paginate: bool):
     """Build a ProcessingManager wired to a fake Daminion session."""
-    session = MagicMock()
-    session.datasource.type = "daminion"
-    session.datasource.daminion_scope = "all"
-    session.datasource.daminion_saved_search_id = None
-    session.datasource.daminion_saved_search = None
-    session.datasource.daminion_collection_id = None
-    session.datasource.daminion_catalog_id = None
-    session.datasource.daminion_search_term = None
-    session.datasource.daminion_untagged_keywords = False
-    session.datasource.daminion_untagged_categories = False
-    session.datasource.daminion_untagged_description = False
-    session.datasource.status_filter = "all"
-    session.datasource.max_items = 0
-
-    session.engine.provider = "local"  # Avoid real model loading
-    session.engine.model_id = "test-model"
-    session.engine.task = "image-classification"
-    session.engine.device = "cpu"
-
-    session.daminion_client = MagicMock()
-    session.processed_items = 0
-    session.failed_items = 0
-    session.total_items = 0
+    # Plain config/counter attributes live on SimpleNamespace objects; only
+    # the Daminion client and reset_stats need to be mocks.
+    datasource = SimpleNamespace(
+        type="daminion",
+        daminion_scope="all",
+        daminion_saved_search_id=None,
+        daminion_saved_search=None,
+        daminion_collection_id=None,
+        daminion_catalog_id=None,
+        daminion_search_term=None,
+        daminion_untagged_keywords=False,
+        daminion_untagged_categories=False,
+        daminion_untagged_description=False,
+        status_filter="all",
+        max_items=0,
+    )
+    engine = SimpleNamespace(
+        provider="local",  # Avoid real model loading
+        model_id="test-model",
+        task="image-classification",
+        device="cpu",
+    )
+    session = SimpleNamespace(
+        datasource=datasource,
+        engine=engine,
+        daminion_client=MagicMock(),
+        processed_items=0,
+        failed_items=0,
+        total_items=0,
+        is_processing=False,
+        reset_stats=MagicMock(),
+    )
+    # A negative pre-flight count means "unknown", so the loop relies on page
+    # sizes alone. Tests that exercise the count override this.
+    session.daminion_client.get_filtered_item_count.return_value = -1
 
     def _reset_stats():
         session.processed_items = 0
@@ -72,21 +94,49 @@ def _make_manager(auto_paginate: bool):
     return manager, session
 
 
-class TestAutoPaginateManagerLoop(unittest.TestCase):
+@pytest.fixture(scope="class")
+def _stubbed_processing():
+    """
+    Stub out item processing and model loading once per test class, so the
+    patchers are started a single time rather than around every test.
+    """
+    with patch.object(ProcessingManager, '_process_single_item', return_value=None), \
+         patch.object(ProcessingManager, '_init_local_model', return_value=None):
+        yield
+
+
+@pytest.fixture
+def stubbed_manager(_stubbed_processing):
+    """
+    Return the ``_make_manager`` factory while processing is stubbed out,
+    so ``_run_job`` only exercises the fetch loop.
+    """
+    return _make_manager
+
+
+class TestAutoPaginateManagerLoop:
     """Verify ProcessingManager drives pagination with the reload-search strategy."""
 
-    def _run_fetch_only(self, auto_paginate: bool, page_sizes: list):
+    @pytest.mark.parametrize("auto_paginate, page_sizes, expected_fetches", [
+        # Full first page triggers one reload, partial second page ends it
+        (True, [500, 200], 2),
+        # Three full reloads followed by an empty response terminates cleanly
+        (True, [500, 500, 500, 0], 4),
+        # With auto_paginate=False the loop stops after the first page
+        (False, [500, 200], 1),
+        # Empty first page exits without calling fetch again
+        (True, [0], 1),
+    ], ids=["full-then-partial", "three-full-then-empty", "no-auto-paginate", "empty-first-page"])
+    def test_fetch_count(self, stubbed_manager, auto_paginate, page_sizes, expected_fetches):
         """
-        Simulate _run_job up to the fetch loop only (no real item processing).
+        Drive _run_job through the fetch loop and count get_items_filtered calls.
 
-        Returns the number of times _fetch_items was called.  In the new
-        reload-search strategy every call uses offset=0, so what matters is
-        the call *count*, not the offset sequence.
-
-        Each successive page returns items with distinct IDs so the
-        infinite-loop guard does not trigger prematurely.
+        In the reload-search strategy every call uses offset=0, so what
+        matters is the call *count*, not the offset sequence. Each successive
+        page returns items with distinct IDs so the infinite-loop guard does
+        not trigger prematurely.
         """
-        manager, session = _make_manager(auto_paginate)
+        manager, session = stubbed_manager(auto_paginate)
 
         call_count = [0]
 
@@ -96,56 +146,30 @@ class TestAutoPaginateManagerLoop(unittest.TestCase):
             size = page_sizes[idx] if idx < len(page_sizes) else 0
             # Use a distinct ID range per page so the duplicate-ID guard
             # (which only fires when identical IDs are returned) stays silent.
-            return _make_dummy_items(size, id_offset=idx * 10000)
+            return _make_dummy_items(size, id_offset=idx * 500)
 
         session.daminion_client.get_items_filtered.side_effect = fake_get_items_filtered
 
-        # Patch _process_single_item so we don't need a real model
-        with patch.object(manager, '_process_single_item', return_value=None):
-            with patch.object(manager, '_init_local_model', return_value=None):
-                manager._run_job()
-
-        return call_count[0]
+        manager._run_job()
 
-    def test_auto_paginate_calls_second_fetch_when_first_is_full(self):
-        """With auto_paginate=True a full first page should trigger a second reload."""
-        fetches = self._run_fetch_only(
-            auto_paginate=True,
-            page_sizes=[500, 200],  # page 1 full → reload → page 2 partial → done
-        )
-        self.assertEqual(fetches, 2,
-                         "Expected exactly two fetches: initial load + one reload")
+        assert call_count[0] == expected_fetches
 
-    def test_auto_paginate_three_full_pages_then_empty(self):
-        """Three full reloads followed by an empty response terminates cleanly."""
-        fetches = self._run_fetch_only(
-            auto_paginate=True,
-            page_sizes=[500, 500, 500, 0],
-        )
-        self.assertEqual(fetches, 4,
-                         "Expected 4 fetch calls: 3 full batches + 1 empty that stops the loop")
+    def test_zero_preflight_count_still_fetches_first_page(self, stubbed_manager):
+        """A pre-flight count of zero is a heuristic; the first page decides."""
+        manager, session = stubbed_manager(auto_paginate=True)
+        session.daminion_client.get_filtered_item_count.return_value = 0
+        session.daminion_client.get_items_filtered.side_effect = [
+            _make_dummy_items(3), _make_dummy_items(0),
+        ]
 
-    def test_no_auto_paginate_stops_after_one_full_page(self):
-        """With auto_paginate=False the loop should stop after the first page."""
-        fetches = self._run_fetch_only(
-            auto_paginate=False,
-            page_sizes=[500, 200],  # second fetch should never happen
-        )
-        self.assertEqual(fetches, 1,
-                         "Expected only one fetch when auto_paginate=False")
+        manager._run_job()
 
-    def test_no_items_on_first_page_logs_and_exits(self):
-        """Empty first page should exit cleanly without calling fetch again."""
-        fetches = self._run_fetch_only(
-            auto_paginate=True,
-            page_sizes=[0],
-        )
-        self.assertEqual(fetches, 1,
-                         "Expected exactly one fetch attempt even when empty")
+        session.daminion_client.get_items_filtered.assert_called_once()
+        assert session.processed_items == 3
 
-    def test_infinite_loop_guard_fires_on_duplicate_ids(self):
+    def test_infinite_loop_guard_fires_on_duplicate_ids(self, stubbed_manager):
         """Reload returning identical IDs should trigger the guard and stop."""
-        manager, session = _make_manager(auto_paginate=True)
+        manager, session = stubbed_manager(auto_paginate=True)
 
         # Both calls return identical item IDs – simulates a server that does
         # not filter out tagged items, which would loop forever without the guard.
@@ -158,25 +182,74 @@ class TestAutoPaginateManagerLoop(unittest.TestCase):
 
         session.daminion_client.get_items_filtered.side_effect = fake_get_items_filtered
 
-        with patch.object(manager, '_process_single_item', return_value=None):
-            with patch.object(manager, '_init_local_model', return_value=None):
-                manager._run_job()
+        manager._run_job()
 
         # Should have fetched exactly twice: first call (processes items),
         # second call (same IDs detected → guard fires → stops).
-        self.assertEqual(call_count[0], 2,
-                         "Infinite-loop guard should stop after two fetches with identical IDs")
+        assert call_count[0] == 2, \
+            "Infinite-loop guard should stop after two fetches with identical IDs"
+
+    def test_prefetch_downloads_next_image_before_current_item_finishes(self):
+        """Item N+1's image download is issued while item N is still processing."""
+        manager, session = _make_manager(auto_paginate=False)
+        session.daminion_client.get_filtered_item_count.return_value = 2
+        session.daminion_client.get_items_filtered.return_value = _make_dummy_items(2)
+        next_download_started = threading.Event()
+        processed = []
+
+        def fake_download(item):
+            if item["id"] == 1:
+                next_download_started.set()
+            return f"path-{item['id']}"
+
+        def fake_process(item, image=None):
+            if item["id"] == 0:
+                # Blocks until the prefetch for the second item has begun
+                assert next_download_started.wait(timeout=5)
+            processed.append((item["id"], image.result()))
+
+        with patch.object(ProcessingManager, '_init_local_model', return_value=None), \
+             patch.object(ProcessingManager, '_download_daminion_image', side_effect=fake_download), \
+             patch.object(ProcessingManager, '_process_single_item', side_effect=fake_process):
+            manager._run_job()
+
+        assert processed == [(0, "path-0"), (1, "path-1")]
+
+    def test_prefetch_stops_at_process_limit(self):
+        """No image is downloaded for items past the configured process limit."""
+        manager, session = _make_manager(auto_paginate=False)
+        session.datasource.max_items = 2
+        session.daminion_client.get_filtered_item_count.return_value = 5
+        session.daminion_client.get_items_filtered.return_value = _make_dummy_items(5)
+        downloaded = []
+
+        def fake_download(item):
+            downloaded.append(item["id"])
+            return f"path-{item['id']}"
+
+        with patch.object(ProcessingManager, '_init_local_model', return_value=None), \
+             patch.object(ProcessingManager, '_download_daminion_image', side_effect=fake_download), \
+             patch.object(ProcessingManager, '_process_single_item', return_value=None):
+            manager._run_job()
+
+        assert session.processed_items == 2
+        assert downloaded == [0, 1]
 
 
 class TestGetItemsFilteredSinglePage(unittest.TestCase):
     """Verify get_items_filtered itself never returns more than one batch."""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         from src.core.daminion_client import DaminionClient
-        self.client = DaminionClient.__new__(DaminionClient)
-        self.client._tag_name_to_id = {}
-        self.client._tag_id_to_name = {}
-        self.client._tag_schema = []
+        cls._template_client = DaminionClient.__new__(DaminionClient)
+        cls._template_client._tag_name_to_id = {}
+        cls._template_client._tag_id_to_name = {}
+        cls._template_client._tag_schema = []
+
+    def setUp(self):
+        # Shallow copy: the tag caches stay empty, only _api differs per test
+        self.client = copy.copy(self._template_client)
 
         # Mock the underlying API layer
         self.mock_api = MagicMock()
@@ -0,0 +1,128 @@
+"""
+Unit tests for the registry credential cache.
+
+`registry_config` depends on the Windows-only `winreg` module, so these tests
+load it against a small in-memory registry that implements the handful of
+`winreg` calls the module makes.
+"""
+
+import importlib
+import sys
+import types
+
+import pytest
+
+
+class _FakeKey:
+    def __init__(self, values):
+        self.values = values
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+def _fake_winreg(store, reads):
+    """Build a `winreg` stand-in backed by ``store`` (key path -> values)."""
+    fake = types.ModuleType("winreg")
+    fake.HKEY_CURRENT_USER = object()
+    fake.KEY_ALL_ACCESS = 0xF003F
+    fake.KEY_READ = 0x20019
+    fake.REG_SZ = 1
+    fake.HKEYType = _FakeKey
+    fake.read_error = None
+
+    def open_key(root, path, reserved=0, access=0):
+        reads.append(path)
+        if fake.read_error is not None:
+            raise fake.read_error
+        if path not in store:
+            raise FileNotFoundError(path)
+        return _FakeKey(store[path])
+
+    def create_key(root, path):
+        return _FakeKey(store.setdefault(path, {}))
+
+    def set_value_ex(key, name, reserved, kind, value):
+        key.values[name] = value
+
+    def query_value_ex(key, name):
+        if name not in key.values:
+            raise FileNotFoundError(name)
+        return key.values[name], fake.REG_SZ
+
+    def delete_key(root, path):
+        if path not in store:
+            raise FileNotFoundError(path)
+        del store[path]
+
+    fake.OpenKey = open_key
+    fake.CreateKey = create_key
+    fake.SetValueEx = set_value_ex
+    fake.QueryValueEx = query_value_ex
+    fake.DeleteKey = delete_key
+    return fake
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Import `registry_config` fresh against an empty in-memory registry."""
+    store, reads = {}, []
+    fake = _fake_winreg(store, reads)
+    monkeypatch.setitem(sys.modules, "winreg", fake)
+    monkeypatch.delitem(sys.modules, "src.utils.registry_config", raising=False)
+    module = importlib.import_module("src.utils.registry_config")
+    yield types.SimpleNamespace(module=module, winreg=fake, reads=reads)
+    sys.modules.pop("src.utils.registry_config", None)
+
+
+def test_save_invalidates_cached_missing_credentials(registry):
+    cfg = registry.module
+    assert cfg.load_daminion_credentials() is None
+    assert cfg.credentials_exist() is False
+
+    assert cfg.save_daminion_credentials("http://dam.local", "user", "secret")
+
+    assert cfg.credentials_exist() is True
+    assert cfg.load_daminion_credentials() == {
+        "url": "http://dam.local",
+        "username": "user",
+        "password": "secret",
+    }
+
+
+def test_delete_invalidates_cached_credentials(registry):
+    cfg = registry.module
+    cfg.save_daminion_credentials("http://dam.local", "user", "secret")
+    assert cfg.load_daminion_credentials() is not None
+    assert cfg.credentials_exist() is True
+
+    assert cfg.delete_daminion_credentials()
+
+    assert cfg.load_daminion_credentials() is None
+    assert cfg.credentials_exist() is False
+
+
+def test_repeated_loads_are_served_from_cache(registry):
+    cfg = registry.module
+    cfg.save_daminion_credentials("http://dam.local", "user", "secret")
+    registry.reads.clear()
+
+    first = cfg.load_daminion_credentials()
+    first["password"] = "changed"
+
+    assert cfg.load_daminion_credentials()["password"] == "secret"
+    assert len(registry.reads) == 1
+
+
+def test_read_failure_is_not_cached(registry):
+    cfg = registry.module
+    cfg.save_daminion_credentials("http://dam.local", "user", "secret")
+
+    registry.winreg.read_error = PermissionError("registry busy")
+    assert cfg.load_daminion_credentials() is None
+
+    registry.winreg.read_error = None
+    assert cfg.load_daminion_credentials()["username"] == "user"